@@ -27,7 +27,7 @@ if not logging.root.handlers:
 
 # add ArviZ's styles to matplotlib's styles
 try:
-    from matplotlib.pyplot import style
+    from matplotlib import style
     from matplotlib.colors import LinearSegmentedColormap
     import matplotlib as mpl
 
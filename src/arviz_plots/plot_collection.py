@@ -928,6 +928,31 @@ class PlotCollection:
             aes_kwargs = self.get_aes_kwargs(aes, var_name, sel_plus)
             yield target, var_name, sel, isel, aes_kwargs
 
+    def for_each_plot(self, fun, **kwargs):
+        """Call a function once per :term:`plot` in the collection.
+
+        Unlike :meth:`~arviz_plots.PlotCollection.map` there is no data subsetting,
+        aesthetic mapping nor artist storage involved. It is meant for functions
+        that act on the plots themselves, like :func:`~arviz_plots.visuals.remove_axis`.
+
+        Parameters
+        ----------
+        fun : callable
+            Function with signature ``fun(da, target, backend, **kwargs)``,
+            same as the functions in :mod:`arviz_plots.visuals`.
+            As there is no data subsetting, `da` is always ``None``.
+        **kwargs : mapping, optional
+            Keyword arguments passed as is to `fun`.
+        """
+        viz_dt = self.viz
+        if "plot" in viz_dt.data_vars:
+            plot_arrays = [viz_dt["plot"].values]
+        else:
+            plot_arrays = [child["plot"].values for child in viz_dt.children.values()]
+        for plot_array in plot_arrays:
+            for target in plot_array.flat:
+                fun(None, target=target, backend=self.backend, **kwargs)
+
     def map(
         self,
         fun,
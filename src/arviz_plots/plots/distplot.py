@@ -1,6 +1,6 @@
 """dist plot code."""
 import warnings
-from copy import copy
+from collections import namedtuple
 
 import arviz_stats  # pylint: disable=unused-import
 import xarray as xr
@@ -19,6 +19,50 @@ from arviz_plots.visuals import (
     scatter_x,
 )
 
+_DEFAULT_LABELLER = BaseLabeller()
+_VALID_CI_KINDS = frozenset(("hdi", "eti", None))
+
+_DistDefaults = namedtuple(
+    "_DistDefaults", ["sample_dims", "ci_prob", "ci_kind", "point_estimate", "kind"]
+)
+
+
+def _resolve_defaults(sample_dims, ci_prob, ci_kind, point_estimate, kind):
+    """Fill in the arguments left as ``None`` with their rcParams defaults."""
+    if sample_dims is None:
+        sample_dims = rcParams["data.sample_dims"]
+    if isinstance(sample_dims, str):
+        sample_dims = [sample_dims]
+    if ci_prob is None:
+        ci_prob = rcParams["stats.ci_prob"]
+    if ci_kind is None:
+        ci_kind = rcParams.get("stats.ci_kind", "eti")
+    if point_estimate is None:
+        point_estimate = rcParams["stats.point_estimate"]
+    if kind is None:
+        kind = rcParams["plot.density_kind"]
+    return _DistDefaults(sample_dims, ci_prob, ci_kind, point_estimate, kind)
+
+
+def _copy_kwargs(plot_kwargs, key):
+    """Get a shallow copy of ``plot_kwargs[key]``, or ``False`` if the artist is disabled."""
+    kwargs = plot_kwargs.get(key, {})
+    return kwargs if kwargs is False else {**kwargs}
+
+
+def _point_y_kde(density_max, point):
+    """Position the point estimate text relative to the kde maximum."""
+    point_density_diff = [dim for dim in density_max.dims if dim not in point.dims]
+    return 0.04 * density_max.max(dim=point_density_diff)
+
+
+def _point_y_ecdf(density_max, point):  # pylint: disable=unused-argument
+    """Position the point estimate text for an ecdf, whose max is always 1."""
+    return xr.full_like(point, 0.04)
+
+
+_POINT_Y_FNS = {"kde": _point_y_kde, "ecdf": _point_y_ecdf}
+
 
 def plot_dist(
     dt,
@@ -161,21 +205,12 @@ def plot_dist(
         >>> )
 
     """
-    if ci_kind not in ("hdi", "eti", None):
+    if ci_kind not in _VALID_CI_KINDS:
         raise ValueError("ci_kind must be either 'hdi' or 'eti'")
 
-    if sample_dims is None:
-        sample_dims = rcParams["data.sample_dims"]
-    if isinstance(sample_dims, str):
-        sample_dims = [sample_dims]
-    if ci_prob is None:
-        ci_prob = rcParams["stats.ci_prob"]
-    if ci_kind is None:
-        ci_kind = rcParams["stats.ci_kind"] if "stats.ci_kind" in rcParams else "eti"
-    if point_estimate is None:
-        point_estimate = rcParams["stats.point_estimate"]
-    if kind is None:
-        kind = rcParams["plot.density_kind"]
+    sample_dims, ci_prob, ci_kind, point_estimate, kind = _resolve_defaults(
+        sample_dims, ci_prob, ci_kind, point_estimate, kind
+    )
     if plot_kwargs is None:
         plot_kwargs = {}
     if pc_kwargs is None:
@@ -189,15 +224,18 @@ def plot_dist(
     distribution = process_group_variables_coords(
         dt, group=group, var_names=var_names, filter_vars=filter_vars, coords=coords
     )
+    # load lazily backed data (i.e. from netcdf or dask) only once so that all the
+    # stats computations and the facetting loops read from memory
+    distribution = distribution.compute()
 
     if plot_collection is None:
         if backend is None:
             backend = rcParams["plot.backend"]
         pc_kwargs.setdefault("col_wrap", 5)
+        excluded_dims = {"model", *sample_dims}
         pc_kwargs.setdefault(
             "cols",
-            ["__variable__"]
-            + [dim for dim in distribution.dims if dim not in {"model"}.union(sample_dims)],
+            ["__variable__", *(dim for dim in distribution.dims if dim not in excluded_dims)],
         )
         if "model" in distribution:
             pc_kwargs["aes"] = pc_kwargs.get("aes", {}).copy()
@@ -213,17 +251,18 @@ def plot_dist(
         aes_map = {}
     else:
         aes_map = aes_map.copy()
-    aes_map.setdefault(kind, plot_collection.aes_set.difference("y"))
+    if kind not in aes_map:
+        aes_map[kind] = plot_collection.aes_set - {"y"}
     if "model" in distribution:
         aes_map.setdefault("credible_interval", ["color", "y"])
         aes_map.setdefault("point_estimate", ["color", "y"])
     if "point_estimate" in aes_map and "point_estimate_text" not in aes_map:
         aes_map["point_estimate_text"] = aes_map["point_estimate"]
     if labeller is None:
-        labeller = BaseLabeller()
+        labeller = _DEFAULT_LABELLER
 
     # density
-    density_kwargs = copy(plot_kwargs.get(kind, {}))
+    density_kwargs = _copy_kwargs(plot_kwargs, kind)
 
     if density_kwargs is not False:
         density_dims, _, density_ignore = filter_aes(plot_collection, aes_map, kind, sample_dims)
@@ -253,20 +292,25 @@ def plot_dist(
         else:
             raise NotImplementedError("coming soon")
 
+        # single reduction over the density, reused to scale the "y" aesthetic
+        # and to position the point estimate text. ecdf max is always 1 so only
+        # its dimensions are needed
+        density_y = density.sel(plot_axis="y", drop=True)
+        if kind == "kde":
+            density_max = density_y.max("kde_dim")
+        else:
+            density_max = xr.ones_like(density_y.isel(quantile=0, drop=True))
+
     if (
-        (density_kwargs is not None)
+        (density_kwargs is not False)
         and ("model" in distribution)
         and (plot_collection.coords is None)
     ):
-        reduce_dim_map = {"kde": "kde_dim", "ecdf": "quantile"}
-        y_ds = plot_collection.get_aes_as_dataset("y")
-        y_ds = (
-            0.15 * y_ds * density.sel(plot_axis="y", drop=True).max([reduce_dim_map[kind], "model"])
-        )
+        y_ds = 0.15 * plot_collection.get_aes_as_dataset("y") * density_max.max("model")
         plot_collection.update_aes_from_dataset("y", y_ds)
 
     # credible interval
-    ci_kwargs = copy(plot_kwargs.get("credible_interval", {}))
+    ci_kwargs = _copy_kwargs(plot_kwargs, "credible_interval")
     if ci_kwargs is not False:
         ci_dims, ci_aes, ci_ignore = filter_aes(
             plot_collection, aes_map, "credible_interval", sample_dims
@@ -285,8 +329,8 @@ def plot_dist(
         plot_collection.map(line_x, "credible_interval", data=ci, ignore_aes=ci_ignore, **ci_kwargs)
 
     # point estimate
-    pe_kwargs = copy(plot_kwargs.get("point_estimate", {}))
-    pet_kwargs = copy(plot_kwargs.get("point_estimate_text", {}))
+    pe_kwargs = _copy_kwargs(plot_kwargs, "point_estimate")
+    pet_kwargs = _copy_kwargs(plot_kwargs, "point_estimate_text")
     if (pe_kwargs is not False) or (pet_kwargs is not False):
         pe_dims, pe_aes, pe_ignore = filter_aes(
             plot_collection, aes_map, "point_estimate", sample_dims
@@ -311,17 +355,10 @@ def plot_dist(
     if pet_kwargs is not False:
         if density_kwargs is False:
             point_y = xr.ones_like(point)
-        elif kind == "kde":
-            point_density_diff = [
-                dim for dim in density.sel(plot_axis="y").dims if dim not in point.dims
-            ]
-            point_density_diff = ["kde_dim"] + point_density_diff
-            point_y = 0.04 * density.sel(plot_axis="y", drop=True).max(dim=point_density_diff)
-        elif kind == "ecdf":
-            # ecdf max is always 1
-            point_y = xr.full_like(point, 0.04)
+        else:
+            point_y = _POINT_Y_FNS[kind](density_max, point)
 
-        point = xr.concat((point, point_y), dim="plot_axis").assign_coords(plot_axis=["x", "y"])
+        point = xr.concat((point, point_y), dim=xr.DataArray(["x", "y"], dims="plot_axis"))
         _, pet_aes, pet_ignore = filter_aes(
             plot_collection, aes_map, "point_estimate_text", sample_dims
         )
@@ -339,7 +376,7 @@ def plot_dist(
         )
 
     # aesthetics
-    title_kwargs = copy(plot_kwargs.get("title", {}))
+    title_kwargs = _copy_kwargs(plot_kwargs, "title")
     if title_kwargs is not False:
         _, title_aes, title_ignore = filter_aes(plot_collection, aes_map, "title", sample_dims)
         if "color" not in title_aes:
@@ -353,8 +390,6 @@ def plot_dist(
             **title_kwargs,
         )
     if (kind == "kde") and (plot_kwargs.get("remove_axis", True) is not False):
-        plot_collection.map(
-            remove_axis, store_artist=False, axis="y", ignore_aes=plot_collection.aes_set
-        )
+        plot_collection.for_each_plot(remove_axis, axis="y")
 
     return plot_collection
@@ -531,8 +531,6 @@ def plot_forest(
         plot_bknd.xlim(xlim_forest, plot_collection.get_target(None, {"column": "forest"}))
 
     if plot_kwargs.get("remove_axis", True) is not False:
-        plot_collection.map(
-            remove_axis, store_artist=False, axis="y", ignore_aes=plot_collection.aes_set
-        )
+        plot_collection.for_each_plot(remove_axis, axis="y")
 
     return plot_collection
@@ -3,11 +3,19 @@
 import logging
 import os
 
+import numpy as np
 import pytest
+from arviz_base import from_dict
 from hypothesis import settings
 
 _log = logging.getLogger("arviz_plots")
 
+# sizes of the shared test data, big enough for the stats not to degenerate
+CHAIN = 2
+DRAW = 16
+HIER = 3
+GROUP = 2
+
 settings.register_profile("fast", deadline=1000, max_examples=20)
 settings.register_profile("chron", deadline=1000, max_examples=500)
 settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
@@ -20,6 +28,15 @@ def pytest_addoption(parser):
     parser.addoption("--skip-bokeh", action="store_const", const=True, help="Skip bokeh tests")
 
 
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Use the non-interactive Agg backend so matplotlib tests never probe for a GUI."""
+    try:
+        import matplotlib
+    except ImportError:
+        return
+    matplotlib.use("Agg")
+
+
 @pytest.fixture(scope="session")
 def save_figs(request):
     """Enable command line switch for saving generation figures upon testing."""
@@ -80,3 +97,77 @@ def check_skips(request):
 def no_artist_kwargs(monkeypatch):
     """Raise an error if artist kwargs are present when using 'none' backend."""
     monkeypatch.setattr("arviz_plots.backend.none.ALLOW_KWARGS", False)
+
+
+@pytest.fixture(scope="session")
+def datatree(seed=31):
+    """DataTree with posterior and sample_stats groups."""
+    rng = np.random.default_rng(seed)
+    mu = rng.standard_normal(size=(CHAIN, DRAW), dtype=np.float32)
+    tau = rng.standard_normal(size=(CHAIN, DRAW), dtype=np.float32)
+    theta = rng.standard_normal(size=(CHAIN, DRAW, HIER), dtype=np.float32)
+    diverging = rng.random(size=(CHAIN, DRAW)) < 0.1
+
+    return from_dict(
+        {
+            "posterior": {"mu": mu, "theta": theta, "tau": tau},
+            "sample_stats": {"diverging": diverging},
+        },
+        dims={"theta": ["hierarchy"]},
+    )
+
+
+@pytest.fixture(scope="session")
+def datatree2(seed=17):
+    """DataTree like `datatree` with an extra posterior variable."""
+    rng = np.random.default_rng(seed)
+    mu = rng.standard_normal(size=(CHAIN, DRAW), dtype=np.float32)
+    tau = rng.standard_normal(size=(CHAIN, DRAW), dtype=np.float32)
+    theta = rng.standard_normal(size=(CHAIN, DRAW, HIER), dtype=np.float32)
+    theta_t = rng.standard_normal(size=(CHAIN, DRAW, HIER), dtype=np.float32)
+    diverging = rng.random(size=(CHAIN, DRAW)) < 0.1
+
+    return from_dict(
+        {
+            "posterior": {"mu": mu, "theta": theta, "tau": tau, "theta_t": theta_t},
+            "sample_stats": {"diverging": diverging},
+        },
+        dims={"theta": ["hierarchy"], "theta_t": ["hierarchy"]},
+    )
+
+
+@pytest.fixture(scope="session")
+def datatree_4d(seed=31):
+    """DataTree with a posterior variable with two extra dimensions."""
+    rng = np.random.default_rng(seed)
+    mu = rng.standard_normal(size=(CHAIN, DRAW), dtype=np.float32)
+    theta = rng.standard_normal(size=(CHAIN, DRAW, HIER), dtype=np.float32)
+    eta = rng.standard_normal(size=(CHAIN, DRAW, HIER, GROUP), dtype=np.float32)
+    diverging = rng.random(size=(CHAIN, DRAW)) < 0.1
+
+    return from_dict(
+        {
+            "posterior": {"mu": mu, "theta": theta, "eta": eta},
+            "sample_stats": {"diverging": diverging},
+        },
+        dims={"theta": ["hierarchy"], "eta": ["hierarchy", "group"]},
+    )
+
+
+@pytest.fixture(scope="session")
+def datatree_sample(seed=31):
+    """DataTree with a single ``sample`` dimension as sample dims."""
+    rng = np.random.default_rng(seed)
+    mu = rng.standard_normal(size=DRAW, dtype=np.float32)
+    tau = rng.standard_normal(size=DRAW, dtype=np.float32)
+    theta = rng.standard_normal(size=(DRAW, HIER), dtype=np.float32)
+    diverging = rng.random(size=DRAW) < 0.1
+
+    return from_dict(
+        {
+            "posterior": {"mu": mu, "theta": theta, "tau": tau},
+            "sample_stats": {"diverging": diverging},
+        },
+        dims={"theta": ["hierarchy"]},
+        sample_dims=["sample"],
+    )
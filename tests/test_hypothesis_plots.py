@@ -12,12 +12,12 @@ pytestmark = pytest.mark.usefixtures("no_artist_kwargs")
 
 
 @pytest.fixture(scope="module")
-def datatree(seed=31):
+def hyp_datatree(seed=31):
     rng = np.random.default_rng(seed)
     mu = rng.normal(size=(3, 50))
     tau = rng.normal(size=(3, 50, 2))
     theta = rng.normal(size=(3, 50, 2, 3))
-    diverging = rng.choice([True, False], size=(3, 50), p=[0.1, 0.9])
+    diverging = rng.random(size=(3, 50)) < 0.1
 
     return from_dict(
         {
@@ -59,12 +59,12 @@ def labels_shade(draw, elements):
     ci_kind=ci_kind_value,
     point_estimate=point_estimate_value,
 )
-def test_plot_dist(datatree, kind, ci_kind, point_estimate, plot_kwargs):
+def test_plot_dist(hyp_datatree, kind, ci_kind, point_estimate, plot_kwargs):
     kind_kwargs = plot_kwargs.pop("kind", None)
     if kind_kwargs is not None:
         plot_kwargs[kind] = kind_kwargs
     pc = plot_dist(
-        datatree,
+        hyp_datatree,
         backend="none",
         kind=kind,
         ci_kind=ci_kind,
@@ -97,11 +97,13 @@ def test_plot_dist(datatree, kind, ci_kind, point_estimate, plot_kwargs):
     point_estimate=point_estimate_value,
     labels_shade_label=labels_shade(st.sampled_from(("__variable__", "hierarchy", "group"))),
 )
-def test_plot_forest(datatree, combined, ci_kind, point_estimate, plot_kwargs, labels_shade_label):
+def test_plot_forest(
+    hyp_datatree, combined, ci_kind, point_estimate, plot_kwargs, labels_shade_label
+):
     labels = labels_shade_label[0]
     shade_label = labels_shade_label[1]
     pc = plot_forest(
-        datatree,
+        hyp_datatree,
         backend="none",
         combined=combined,
         ci_kind=ci_kind,
@@ -597,3 +597,32 @@ class TestMap:
             assert isinstance(kwargs["ds"], DataArray)
             assert "school" not in kwargs["ds"].dims
             assert "school" not in kwargs["da_hierarchy"].dims
+
+    def test_for_each_plot(self, dataset):
+        pc = generate_plot_collection1(dataset)
+        call_list = []
+
+        def fun(da, target, backend, **kwargs):
+            call_list.append((da, target, backend, kwargs))
+
+        pc.for_each_plot(fun, axis="y")
+        assert [call[1] for call in call_list] == ["mu_plot", "theta_plot", "eta_plot"]
+        assert all(call[0] is None for call in call_list)
+        assert all(call[2] == "backend" for call in call_list)
+        assert all(call[3] == {"axis": "y"} for call in call_list)
+        assert all("fun" not in pc.viz[var_name] for var_name in dataset.data_vars)
+
+    def test_for_each_plot_root(self, dataset):
+        plot = [[f"plot_{row}{col}" for col in range(3)] for row in range(2)]
+        viz_dt = DataTree.from_dict(
+            {"/": Dataset({"chart": "chart", "plot": (("row_dim", "col_dim"), plot)})}
+        )
+        pc = PlotCollection(dataset, viz_dt=viz_dt, backend="none")
+        target_list = []
+
+        def fun(da, target, backend, **kwargs):  # pylint: disable=unused-argument
+            assert backend == "none"
+            target_list.append(target)
+
+        pc.for_each_plot(fun)
+        assert target_list == [target for row in plot for target in row]
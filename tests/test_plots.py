@@ -2,7 +2,7 @@
 """Test batteries-included plots."""
 import numpy as np
 import pytest
-from arviz_base import from_dict
+from datatree import DataTree, open_datatree
 
 from arviz_plots import plot_dist, plot_forest, plot_trace, plot_trace_dist, visuals
 
@@ -13,74 +13,14 @@ pytestmark = [
 ]
 
 
-@pytest.fixture(scope="module")
-def datatree(seed=31):
-    rng = np.random.default_rng(seed)
-    mu = rng.normal(size=(4, 100))
-    tau = rng.normal(size=(4, 100))
-    theta = rng.normal(size=(4, 100, 7))
-    diverging = rng.choice([True, False], size=(4, 100), p=[0.1, 0.9])
-
-    return from_dict(
-        {
-            "posterior": {"mu": mu, "theta": theta, "tau": tau},
-            "sample_stats": {"diverging": diverging},
-        },
-        dims={"theta": ["hierarchy"]},
-    )
-
-
-@pytest.fixture(scope="module")
-def datatree2(seed=17):
-    rng = np.random.default_rng(seed)
-    mu = rng.normal(size=(4, 100))
-    tau = rng.normal(size=(4, 100))
-    theta = rng.normal(size=(4, 100, 7))
-    theta_t = rng.normal(size=(4, 100, 7))
-    diverging = rng.choice([True, False], size=(4, 100), p=[0.1, 0.9])
-
-    return from_dict(
-        {
-            "posterior": {"mu": mu, "theta": theta, "tau": tau, "theta_t": theta_t},
-            "sample_stats": {"diverging": diverging},
-        },
-        dims={"theta": ["hierarchy"], "theta_t": ["hierarchy"]},
-    )
-
-
-@pytest.fixture(scope="module")
-def datatree_4d(seed=31):
-    rng = np.random.default_rng(seed)
-    mu = rng.normal(size=(4, 100))
-    theta = rng.normal(size=(4, 100, 5))
-    eta = rng.normal(size=(4, 100, 5, 3))
-    diverging = rng.choice([True, False], size=(4, 100), p=[0.1, 0.9])
-
-    return from_dict(
-        {
-            "posterior": {"mu": mu, "theta": theta, "eta": eta},
-            "sample_stats": {"diverging": diverging},
-        },
-        dims={"theta": ["hierarchy"], "eta": ["hierarchy", "group"]},
-    )
+def check_dist_models(pc):
+    assert "kde" in pc.viz["mu"].data_vars
+    assert "hierarchy" not in pc.viz["mu"].dims
+    assert "model" in pc.viz["mu"].dims
 
 
-@pytest.fixture(scope="module")
-def datatree_sample(seed=31):
-    rng = np.random.default_rng(seed)
-    mu = rng.normal(size=100)
-    tau = rng.normal(size=100)
-    theta = rng.normal(size=(100, 7))
-    diverging = rng.choice([True, False], size=100, p=[0.1, 0.9])
-
-    return from_dict(
-        {
-            "posterior": {"mu": mu, "theta": theta, "tau": tau},
-            "sample_stats": {"diverging": diverging},
-        },
-        dims={"theta": ["hierarchy"]},
-        sample_dims=["sample"],
-    )
+def check_forest_models(pc):
+    assert "plot" in pc.viz.data_vars
 
 
 @pytest.mark.parametrize("backend", ["matplotlib", "bokeh", "none"])
@@ -103,19 +43,74 @@ class TestPlots:
         assert "hierarchy" not in pc.viz["mu"]["point_estimate"].dims
         assert "hierarchy" in pc.viz["theta"]["point_estimate"].dims
 
-    def test_plot_dist_models(self, datatree, datatree2, backend):
-        pc = plot_dist({"c": datatree, "n": datatree2}, backend=backend)
+    @pytest.mark.parametrize(
+        "plot_fn, check",
+        ((plot_dist, check_dist_models), (plot_forest, check_forest_models)),
+        ids=("dist", "forest"),
+    )
+    def test_plot_models(self, datatree, datatree2, backend, plot_fn, check):
+        pc = plot_fn({"c": datatree, "n": datatree2}, backend=backend)
         assert "/mu" in pc.aes.groups
         assert "/mu" in pc.viz.groups
-        assert "kde" in pc.viz["mu"].data_vars
-        assert "hierarchy" not in pc.viz["mu"].dims
-        assert "model" in pc.viz["mu"].dims
+        check(pc)
+
+    def test_plot_dist_lazy(self, datatree, backend, tmp_path):
+        datatree.to_netcdf(tmp_path / "lazy.nc", engine="h5netcdf")
+        lazy_dt = open_datatree(tmp_path / "lazy.nc", engine="h5netcdf")
+        pc = plot_dist(lazy_dt, backend=backend)
+        assert "kde" in pc.viz["mu"]
+        assert "hierarchy" in pc.viz["theta"]["point_estimate"].dims
+        assert not isinstance(lazy_dt["posterior"]["mu"].variable._data, np.ndarray)
+
+    def test_plot_dist_dask(self, datatree, backend):
+        pytest.importorskip("dask")
+        posterior = datatree["posterior"].ds
+        # variables chunked differently along the same dimension
+        chunked_dt = DataTree.from_dict(
+            {
+                "posterior": posterior.assign(
+                    mu=posterior["mu"].chunk(draw=4), theta=posterior["theta"].chunk(draw=8)
+                )
+            }
+        )
+        pc = plot_dist(chunked_dt, backend=backend)
+        assert "kde" in pc.viz["mu"]
+        assert "hierarchy" in pc.viz["theta"]["point_estimate"].dims
+
+    @pytest.mark.parametrize("kind", ("kde", "ecdf"))
+    def test_plot_dist_models_aes_y(self, datatree, datatree2, backend, kind):
+        if backend == "bokeh":
+            pytest.skip("bokeh backend can't draw the 2d density lines that keep the model dim")
+        pc = plot_dist(
+            {"c": datatree, "n": datatree2},
+            var_names=["mu", "theta"],
+            backend=backend,
+            kind=kind,
+            pc_kwargs={"aes": {"color": ["chain"]}},
+            aes_map={"credible_interval": ["y"], "point_estimate": ["y"]},
+        )
+        assert "chain" in pc.aes["mu"]["y"].dims
+        assert "model" in pc.viz["mu"]["credible_interval"].dims
+        assert "chain" in pc.viz["mu"]["credible_interval"].dims
+        assert "chain" in pc.viz["mu"]["point_estimate"].dims
+
+    @pytest.mark.parametrize("kind", ("kde", "ecdf"))
+    def test_plot_dist_models_no_density(self, datatree, datatree2, backend, kind):
+        pc = plot_dist(
+            {"c": datatree, "n": datatree2},
+            backend=backend,
+            kind=kind,
+            plot_kwargs={kind: False},
+        )
+        assert kind not in pc.viz["mu"]
+        assert "model" in pc.viz["mu"]["point_estimate"].dims
+        assert "model" in pc.viz["mu"]["credible_interval"].dims
 
     def test_plot_trace(self, datatree, backend):
         pc = plot_trace(datatree, backend=backend)
         assert "chart" in pc.viz.data_vars
         assert "plot" not in pc.viz.data_vars
-        assert pc.viz["mu"].trace.shape == (4,)
+        assert pc.viz["mu"].trace.shape == (datatree["posterior"].sizes["chain"],)
 
     def test_plot_trace_sample(self, datatree_sample, backend):
         pc = plot_trace(datatree_sample, sample_dims="sample", backend=backend)
@@ -162,10 +157,6 @@ class TestPlots:
         pc = plot_forest(datatree_sample, backend=backend, sample_dims="sample")
         assert "plot" in pc.viz.data_vars
 
-    def test_plot_forest_models(self, datatree, datatree2, backend):
-        pc = plot_forest({"c": datatree, "n": datatree2}, backend=backend)
-        assert "plot" in pc.viz.data_vars
-
     def test_plot_forest_extendable(self, datatree, backend):
         dt_aux = (
             datatree["posterior"]